@@ -25,6 +25,8 @@ _model_sha1 = {name: checksum for checksum, name in [
 autogluon_repo_url = 'https://autogluon.s3.amazonaws.com/'
 _url_format = '{repo_url}models/{file_name}.zip'
 
+_verified_model_files = set()  # files whose sha1 was already checked in this process
+
 def short_hash(name):
     if name not in _model_sha1:
         raise ValueError('Pretrained model for {name} is not available.'.format(name=name))
@@ -49,8 +51,11 @@ def get_model_file(name, root=os.path.join('~', '.autogluon', 'models')):
     root = os.path.expanduser(root)
     file_path = os.path.join(root, file_name+'.params')
     sha1_hash = _model_sha1[name]
+    if file_path in _verified_model_files:
+        return file_path  # already hashed this file once, no need to re-read it from disk
     if os.path.exists(file_path):
         if check_sha1(file_path, sha1_hash):
+            _verified_model_files.add(file_path)
             return file_path
         else:
             print('Mismatch in the content of model file {} detected.' +
@@ -73,6 +78,7 @@ def get_model_file(name, root=os.path.join('~', '.autogluon', 'models')):
     os.remove(zip_file_path)
 
     if check_sha1(file_path, sha1_hash):
+        _verified_model_files.add(file_path)
         return file_path
     else:
         raise ValueError('Downloaded file has different hash. Please try again.')
@@ -186,7 +186,10 @@ class StoppingBracket(object):
     def cutoff(self, recorded):
         if not recorded:
             return None
-        return np.percentile(list(recorded.values()), (1 - 1 / self.rf) * 100)
+        # fromiter avoids materializing an intermediate list, and the scratch
+        # array can be partitioned in place since it is thrown away anyway
+        rewards = np.fromiter(recorded.values(), dtype=np.float64, count=len(recorded))
+        return np.percentile(rewards, (1 - 1 / self.rf) * 100, overwrite_input=True)
 
     def on_result(self, task, cur_iter, cur_rew):
         """
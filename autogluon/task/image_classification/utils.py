@@ -32,15 +32,18 @@ def get_data_loader(dataset, input_size, batch_size, num_workers, final_fit, spl
         num_batches = imagenet_samples // batch_size
     else:
         num_workers = 0  # ?
+        pin_memory = mx.context.num_gpus() > 0  # pinned batches make the H2D copy async-capable
         train_data = DataLoader(
             train_dataset, batch_size=batch_size, shuffle=True,
-            last_batch="discard", num_workers=num_workers
+            last_batch="discard", num_workers=num_workers,
+            pin_memory=pin_memory
         )
         val_data = None
         if not final_fit:
             val_data = DataLoader(
                 val_dataset, batch_size=batch_size,
-                shuffle=False, num_workers=num_workers
+                shuffle=False, num_workers=num_workers,
+                pin_memory=pin_memory
             )
         batch_fn = default_batch_fn
         num_batches = len(train_data)
@@ -68,11 +68,20 @@ def preprocess_data(tokenizer, task, batch_size, dev_batch_size, max_len, vocab,
     loader_dev_list = []
     for segment, data in dev_tsv_list:
         data_dev = mx.gluon.data.SimpleDataset(pool.map(trans, data))
+        data_dev_len = data_dev.transform(
+            lambda input_id, length, segment_id, label_id: length, lazy=False)
+        # bucket sampler for evaluation: batches of similar length only pad to the
+        # within-batch max, so short sequences don't pay for the longest one
+        dev_batch_sampler = nlp.data.sampler.FixedBucketSampler(
+            data_dev_len,
+            batch_size=dev_batch_size,
+            num_buckets=10,
+            ratio=0,
+            shuffle=False)
         loader_dev = mx.gluon.data.DataLoader(
             data_dev,
-            batch_size=dev_batch_size,
             num_workers=num_workers,
-            shuffle=False,
+            batch_sampler=dev_batch_sampler,
             batchify_fn=batchify_fn)
         loader_dev_list.append((segment, loader_dev))
 
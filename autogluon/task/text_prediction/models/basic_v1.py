@@ -297,7 +297,11 @@ def _classification_regression_predict(net, dataloader, problem_type, has_label=
     -------
     predictions
     """
-    predictions = []
+    # Preallocate the output buffer once instead of collecting per-batch copies and
+    # concatenating at the end, which would double peak memory on large test sets.
+    num_examples = len(dataloader._dataset)
+    predictions = None
+    offset = 0
     ctx_l = net.collect_params().list_ctx()
     for sample_l in grouper(dataloader, len(ctx_l)):
         iter_pred_l = []
@@ -314,8 +318,14 @@ def _classification_regression_predict(net, dataloader, problem_type, has_label=
                 pred = mx.npx.softmax(pred, axis=-1)
             iter_pred_l.append(pred)
         for pred in iter_pred_l:
-            predictions.append(pred.asnumpy())
-    predictions = np.concatenate(predictions, axis=0)
+            pred = pred.asnumpy()
+            if predictions is None:
+                # Output width (e.g. #classes) is only known after the first batch
+                predictions = np.empty((num_examples,) + pred.shape[1:], dtype=pred.dtype)
+            predictions[offset:(offset + pred.shape[0])] = pred
+            offset += pred.shape[0]
+    if predictions is None:
+        predictions = np.empty((0,), dtype=np.float32)
     return predictions
 
 
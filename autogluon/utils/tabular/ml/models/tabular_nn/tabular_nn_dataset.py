@@ -108,7 +108,11 @@ class TabularNNDataset:
                     vector_inds += feature_arraycol_map[feature]
                     new_last_ind = len(vector_inds) # new last index of the vector datamatrix
                     self.vecfeature_col_map[feature] = list(range(current_last_ind, new_last_ind))
-            data_list.append(mx.nd.array(processed_array[:,vector_inds], dtype='float32')) # Matrix of data from all vector features
+            if vector_inds == list(range(processed_array.shape[1])):
+                vector_data = processed_array  # all columns are vector features in order, skip the fancy-index copy
+            else:
+                vector_data = processed_array[:,vector_inds]
+            data_list.append(mx.nd.array(vector_data, dtype='float32')) # Matrix of data from all vector features
             self.data_desc.append("vector")
             self.vectordata_index = len(data_list) - 1
 
@@ -130,7 +134,7 @@ class TabularNNDataset:
 
         self.num_classes = None
         if labels is not None:
-            labels = np.array(labels)
+            labels = np.asarray(labels)  # view when labels already back a numpy buffer; only copies otherwise
             self.data_desc.append("label")
             self.label_index = len(data_list) # To access data labels, use: self.dataset._data[self.label_index]
             self.num_classes = None
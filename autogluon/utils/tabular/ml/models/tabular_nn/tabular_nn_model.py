@@ -244,7 +244,7 @@ class TabularNeuralNetModel(AbstractModel):
         if initialize:  # Initialize the weights of network
             logging.debug("initializing neural network...")
             self.model.collect_params().initialize(ctx=self.ctx)
-            self.model.hybridize()
+            self.model.hybridize(static_alloc=True)  # static_alloc reuses cached graph memory across forward calls
             logging.debug("initialized")
         if setup_trainer:
             # Also setup mxboard to monitor training if visualizer has been specified:
@@ -415,6 +415,8 @@ class TabularNeuralNetModel(AbstractModel):
             raise ValueError("new_data must of of type TabularNNDataset if process=False")
         if self.problem_type == REGRESSION or not predict_proba:
             preds = nd.zeros((new_data.num_examples,1))
+        elif self.problem_type == BINARY:
+            preds = nd.zeros((new_data.num_examples,1))  # for binary problems, only P(Y==+1) ever leaves the device
         else:
             preds = nd.zeros((new_data.num_examples, self.num_net_outputs))
         i = 0
@@ -427,12 +429,14 @@ class TabularNeuralNetModel(AbstractModel):
                     preds_batch = nd.argmax(preds_batch, axis=1, keepdims=True)
                 else: # need to take softmax
                     preds_batch = nd.softmax(preds_batch, axis=1)
+                    if self.problem_type == BINARY:
+                        preds_batch = preds_batch[:,1:2]  # slice on device so the copy off self.ctx is halved
             preds[i:(i+batch_size)] = preds_batch
             i = i+batch_size
         if self.problem_type == REGRESSION or not predict_proba:
             return preds.asnumpy().flatten()  # return 1D numpy array
         elif self.problem_type == BINARY and predict_proba:
-            return preds[:,1].asnumpy()  # for binary problems, only return P(Y==+1)
+            return preds.asnumpy().flatten()  # for binary problems, only return P(Y==+1)
 
         return preds.asnumpy()  # return 2D numpy array
 
@@ -714,7 +718,7 @@ class TabularNeuralNetModel(AbstractModel):
         if model._architecture_desc is not None:
             model.model = EmbedNet(architecture_desc=model._architecture_desc, ctx=model.ctx)  # recreate network from architecture description
             model._architecture_desc = None
-            # TODO: maybe need to initialize/hybridize?
+            model.model.hybridize(static_alloc=True)  # cache the symbolic graph for inference, same as during training
             model.model.load_parameters(model.path + model.params_file_name, ctx=model.ctx)
             model.summary_writer = None
         return model